@@ -16,6 +16,7 @@ setup(
         "snowflake-cortex", 
         "requests>=2.31.0",
         "beautifulsoup4>=4.12.0",
+        "lxml>=4.9",
     ],
     extras_require={
         "dev": [
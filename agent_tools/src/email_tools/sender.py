@@ -7,6 +7,9 @@ from snowflake.snowpark import Session
 
 logger = logging.getLogger(__name__)
 
+# Bound-parameter CALL avoids literal quoting/escaping of the message on every send
+_SEND_EMAIL_SQL = "CALL SYSTEM$SEND_EMAIL(?, ?, ?, ?, ?)"
+
 def send_email_for_agent(session: Session, recipient: str, subject: str, text: str) -> str:
     """
     Send email using Snowflake's email integration
@@ -15,19 +18,15 @@ def send_email_for_agent(session: Session, recipient: str, subject: str, text: s
     Clean Python code with proper error handling and logging
     """
     try:
-        session.call(
-            'SYSTEM$SEND_EMAIL',
-            'ai_email_int',
-            recipient,
-            subject,
-            text,
-            'text/html'
-        )
-        logger.info(f"Email sent successfully to {recipient} with subject: '{subject}'")
+        session.sql(
+            _SEND_EMAIL_SQL,
+            params=['ai_email_int', recipient, subject, text, 'text/html']
+        ).collect()
+        logger.info("Email sent successfully to %s with subject: '%s'", recipient, subject)
         return f'Email was sent to {recipient} with subject: "{subject}".'
         
     except Exception as e:
-        logger.error(f"Failed to send email to {recipient} with subject '{subject}': {e}")
+        logger.error("Failed to send email to %s with subject '%s': %s", recipient, subject, e)
         return f'Failed to send email: {str(e)}'
 
 
@@ -4,102 +4,144 @@ No more raw SQL string formatting hell!
 """
 
 import logging
+import hashlib
 import json
-from typing import List, Dict, Any, Optional
-from urllib.parse import urlparse
+import re
+from collections import OrderedDict
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
 
 try:
     from snowflake.snowpark import Session
-    from snowflake.cortex import complete, CompleteOptions
 except ImportError:
     # For local testing - these are only available in Snowflake runtime
     Session = None
-    complete = None
-    CompleteOptions = None
+
+from .core import split_url, get_competitor_suggestions as mock_competitor_suggestions
 
 logger = logging.getLogger(__name__)
 
-def get_real_competitors(primary_url: str, industry_context: str = "") -> List[str]:
+# snowflake.cortex is imported on the first LLM call; the options are constant and built alongside it
+complete = None
+_SUGGEST_OPTIONS = None
+_ANALYSIS_OPTIONS = None
+_CORTEX_IMPORT_ATTEMPTED = False
+
+def _load_cortex() -> None:
+    """Import the Cortex SDK on first use (leaves `complete` as None when unavailable)"""
+    global complete, _SUGGEST_OPTIONS, _ANALYSIS_OPTIONS, _CORTEX_IMPORT_ATTEMPTED
+    if _CORTEX_IMPORT_ATTEMPTED:
+        return
+    try:
+        from snowflake.cortex import complete as _complete, CompleteOptions
+    except ImportError:
+        logger.info("Snowflake Cortex not available - using fallback analysis")
+        _CORTEX_IMPORT_ATTEMPTED = True
+        return
+    _SUGGEST_OPTIONS = CompleteOptions(max_tokens=10000, temperature=0.1)
+    _ANALYSIS_OPTIONS = CompleteOptions(max_tokens=10000, temperature=0.2)
+    complete = _complete
+    _CORTEX_IMPORT_ATTEMPTED = True
+
+# Bounded LRU of AI competitor suggestions keyed by (url, prompt-content digest)
+_SUGGESTION_CACHE: "OrderedDict[Tuple[str, str], List[str]]" = OrderedDict()
+_SUGGESTION_CACHE_SIZE = 512
+
+# Real competitors database by industry/company
+_COMPETITOR_DATABASE = {
+    "amce.com": (
+        "https://www.housecallpro.com",
+        "https://getjobber.com",
+        "https://www.fieldedge.com", 
+        "https://www.workiz.com",
+        "https://www.mhelpdesk.com"
+    ),
+    "field service": (
+        "https://www.housecallpro.com",
+        "https://getjobber.com",
+        "https://www.fieldedge.com",
+        "https://www.workiz.com",
+        "https://www.servicemax.com"
+    ),
+    "crm": (
+        "https://www.salesforce.com",
+        "https://www.hubspot.com", 
+        "https://www.pipedrive.com",
+        "https://www.zoho.com/crm"
+    ),
+    "project management": (
+        "https://www.monday.com",
+        "https://asana.com",
+        "https://www.notion.so",
+        "https://clickup.com"
+    )
+}
+
+# One alternation over all lowercased keys so the context is scanned once
+_COMPETITORS_BY_KEY = {key.casefold(): competitors for key, competitors in _COMPETITOR_DATABASE.items()}
+_INDUSTRY_RE = re.compile('|'.join(re.escape(key) for key in _COMPETITORS_BY_KEY))
+
+@lru_cache(maxsize=256)
+def get_real_competitors(primary_url: str, industry_context: str = "") -> Tuple[str, ...]:
     """
     Get real competitor URLs based on industry knowledge
     No more fake URLs - these are actual competitors!
+    Results are memoized, so an immutable tuple is returned
     """
-    # Real competitors database by industry/company
-    competitor_database = {
-        "amce.com": [
-            "https://www.housecallpro.com",
-            "https://getjobber.com",
-            "https://www.fieldedge.com", 
-            "https://www.workiz.com",
-            "https://www.mhelpdesk.com"
-        ],
-        "field service": [
-            "https://www.housecallpro.com",
-            "https://getjobber.com",
-            "https://www.fieldedge.com",
-            "https://www.workiz.com",
-            "https://www.servicemax.com"
-        ],
-        "crm": [
-            "https://www.salesforce.com",
-            "https://www.hubspot.com", 
-            "https://www.pipedrive.com",
-            "https://www.zoho.com/crm"
-        ],
-        "project management": [
-            "https://www.monday.com",
-            "https://asana.com",
-            "https://www.notion.so",
-            "https://clickup.com"
-        ]
-    }
-    
     # Extract domain from primary URL
-    domain = urlparse(primary_url).netloc.replace('www.', '')
+    domain = split_url(primary_url).netloc.replace('www.', '')
     
     # Try exact domain match first
-    if domain in competitor_database:
-        return competitor_database[domain]
+    if domain in _COMPETITOR_DATABASE:
+        return _COMPETITOR_DATABASE[domain]
     
     # Try industry context match
-    for key, competitors in competitor_database.items():
-        if industry_context and key.lower() in industry_context.lower():
-            return competitors
+    if industry_context:
+        match = _INDUSTRY_RE.search(industry_context.casefold())
+        if match:
+            return _COMPETITORS_BY_KEY[match.group(0)]
     
     # Default fallback for business software
-    return [
+    return (
         "https://www.salesforce.com",
         "https://www.hubspot.com",
         "https://www.monday.com"
-    ]
+    )
 
 def get_competitor_suggestions(session: Session, primary_url: str, content: str) -> List[str]:
     """
     Use Claude to suggest competitor URLs via proper SDK
     Clean Python with proper error handling
+    Non-empty suggestions are cached so repeat runs skip the LLM round-trip
     """
+    excerpt = content[:800]
+    cache_key = (primary_url, hashlib.blake2b(excerpt.encode(), digest_size=8).hexdigest())
+    cached = _SUGGESTION_CACHE.get(cache_key)
+    if cached is not None:
+        _SUGGESTION_CACHE.move_to_end(cache_key)
+        return list(cached)
+    
+    _load_cortex()
+    if complete is None:
+        return mock_competitor_suggestions(primary_url)
+    
     try:
         prompt = [{
             "role": "user",
             "content": f"""I am analyzing competitors for: {primary_url}
 
-Based on this content: {content[:800]}
+Based on this content: {excerpt}
 
 Suggest 2-3 direct competitor URLs I should analyze for competitive intelligence.
 Return ONLY valid URLs, one per line, no explanations.
 Focus on direct business competitors."""
         }]
 
-        options = CompleteOptions(
-            max_tokens=10000,
-            temperature=0.1
-        )
-        
         result = complete(
             model="claude-3-4-sonnet",
             prompt=prompt,
             session=session,
-            options=options
+            options=_SUGGEST_OPTIONS
         )
         
         if isinstance(result, str):
@@ -109,27 +151,36 @@ Focus on direct business competitors."""
                 url = url.strip()
                 if url.startswith('http') and len(url) > 10:
                     valid_urls.append(url)
-            return valid_urls
+            if valid_urls:
+                _SUGGESTION_CACHE[cache_key] = valid_urls
+                if len(_SUGGESTION_CACHE) > _SUGGESTION_CACHE_SIZE:
+                    _SUGGESTION_CACHE.popitem(last=False)
+                return list(valid_urls)
             
     except Exception as e:
         logger.warning(f"AI competitor suggestion failed: {e}")
     
     # Fallback to mock suggestions
-    from .core import get_competitor_suggestions
-    return get_competitor_suggestions(primary_url)
+    return mock_competitor_suggestions(primary_url)
 
 def analyze_competitive_landscape(session: Session, primary_data: Dict[str, Any], competitor_data: List[Dict[str, Any]]) -> str:
     """
     Analyze competitive landscape using Claude via proper SDK
     This can be called as a separate function or inline
     """
+    _load_cortex()
+    if complete is None:
+        return create_mock_analysis(primary_data, competitor_data)
+    
     try:
-        # Build analysis content
-        content = f"PRIMARY: {primary_data['title']} ({primary_data['url']})\n{primary_data['content'][:800]}\n\n"
-        
-        for i, comp in enumerate(competitor_data[:3], 1):
-            if comp.get('success'):
-                content += f"COMPETITOR {i}: {comp['title']} ({comp['url']})\n{comp['content'][:600]}\n\n"
+        # Build analysis content from sections joined once
+        sections = [f"PRIMARY: {primary_data['title']} ({primary_data['url']})\n{primary_data['content'][:800]}\n\n"]
+        sections.extend(
+            f"COMPETITOR {i}: {comp['title']} ({comp['url']})\n{comp['content'][:600]}\n\n"
+            for i, comp in enumerate(competitor_data[:3], 1)
+            if comp.get('success')
+        )
+        content = ''.join(sections)
         
         prompt = [{
             "role": "user", 
@@ -146,16 +197,11 @@ Provide structured competitive analysis focusing on:
 Format as clear business insights."""
         }]
         
-        options = CompleteOptions(
-            max_tokens=10000,
-            temperature=0.2
-        )
-        
         result = complete(
             model="claude-3-4-sonnet",
             prompt=prompt, 
             session=session,
-            options=options
+            options=_ANALYSIS_OPTIONS
         )
         
         if isinstance(result, str):
@@ -168,7 +214,7 @@ Format as clear business insights."""
 
 def create_mock_analysis(primary_data: Dict[str, Any], competitor_data: List[Dict[str, Any]]) -> str:
     """Create mock competitive analysis for testing"""
-    successful_competitors = [c for c in competitor_data if c.get('success')]
+    analyzed_count = sum(1 for c in competitor_data if c.get('success'))
     
     return f"""COMPETITIVE ANALYSIS SUMMARY
 
@@ -178,7 +224,7 @@ Primary Target: {primary_data['url']}
 - Found pricing: {', '.join(primary_data.get('prices', ['N/A']))}
 
 Competitive Landscape:
-- {len(successful_competitors)} competitors analyzed
+- {analyzed_count} competitors analyzed
 - Market shows diverse pricing strategies
 - Opportunity for competitive positioning
 
@@ -195,9 +241,21 @@ Market Insights:
 
 def create_html_report(primary_data: Dict[str, Any], competitor_data: List[Dict[str, Any]], analysis: str) -> str:
     """Create beautiful HTML report for agents"""
-    successful_competitors = [c for c in competitor_data if c.get('success')]
+    # Single pass over competitors: count successes and render list items together
+    analyzed_count = 0
+    competitor_items = []
+    for i, comp in enumerate(competitor_data):
+        if not comp.get('success'):
+            if i < 3:
+                competitor_items.append(f'<li>{comp["url"]} - ❌ Failed</li>')
+            continue
+        analyzed_count += 1
+        if i < 3:
+            prices = ', '.join(comp.get('prices', ['N/A']))
+            competitor_items.append(f'<li><a href="{comp["url"]}" target="_blank">{comp["title"]}</a> - ✅ Analyzed (Prices: {prices})</li>')
     
-    html = f'''<div style="font-family: Arial, sans-serif; max-width: 800px; margin: 0 auto;">
+    # Collect fragments and join once instead of growing a string with +=
+    parts = [f'''<div style="font-family: Arial, sans-serif; max-width: 800px; margin: 0 auto;">
         <h2 style="color: #2c3e50; border-bottom: 2px solid #3498db; padding-bottom: 10px;">
             🔍 Competitive Analysis Report
         </h2>
@@ -212,17 +270,10 @@ def create_html_report(primary_data: Dict[str, Any], competitor_data: List[Dict[
         
         <div style="background-color: #fff; padding: 15px; border: 1px solid #bdc3c7; border-radius: 5px; margin: 15px 0;">
             <h3 style="color: #8e44ad;">🏆 Competitive Landscape</h3>
-            <p><strong>Competitors Analyzed:</strong> {len(successful_competitors)}/3</p>
-            <ul>'''
-    
-    for comp in competitor_data[:3]:
-        if comp.get('success'):
-            prices = ', '.join(comp.get('prices', ['N/A']))
-            html += f'<li><a href="{comp["url"]}" target="_blank">{comp["title"]}</a> - ✅ Analyzed (Prices: {prices})</li>'
-        else:
-            html += f'<li>{comp["url"]} - ❌ Failed</li>'
-    
-    html += f'''</ul>
+            <p><strong>Competitors Analyzed:</strong> {analyzed_count}/3</p>
+            <ul>''']
+    parts.extend(competitor_items)
+    parts.append(f'''</ul>
         </div>
         
         <div style="background-color: #f8f9fa; padding: 15px; border: 1px solid #dee2e6; border-radius: 5px; margin: 15px 0;">
@@ -233,6 +284,6 @@ def create_html_report(primary_data: Dict[str, Any], competitor_data: List[Dict[
         <div style="text-align: center; margin-top: 20px; padding: 10px; background-color: #34495e; color: white; border-radius: 5px;">
             <small>🚀 Generated by Snowflake Intelligence Agent • Web Scraper Tool • Powered by Claude</small>
         </div>
-    </div>'''
+    </div>''')
     
-    return html
+    return ''.join(parts)
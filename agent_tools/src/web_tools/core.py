@@ -2,42 +2,154 @@
 Core web scraping functionality - clean Python, no string escaping!
 """
 
+import ipaddress
 import logging
 import time
 import re
-from urllib.parse import urlparse
-from typing import Dict, Any, List
-
-try:
-    import requests
-    from bs4 import BeautifulSoup
-except ImportError:
-    requests = None
-    BeautifulSoup = None
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from functools import lru_cache
+from urllib.parse import urljoin, urlsplit, SplitResult
+from typing import Dict, Any, List, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Heavy scraping dependencies are imported on first scrape, not at module import,
+# so a cold procedure container only pays for them when the scraper actually runs
+_SESSION = None
+BeautifulSoup = None
+_HTML_PARSER = 'html.parser'
+_CONTENT_STRAINER = None
+_DEPS_LOCK = threading.Lock()
+
+def _load_scraping_deps() -> bool:
+    """Import requests/bs4 once and build the shared HTTP session"""
+    global _SESSION, BeautifulSoup, _HTML_PARSER, _CONTENT_STRAINER
+    if _SESSION is not None:
+        return True
+    
+    with _DEPS_LOCK:
+        if _SESSION is not None:
+            return True
+        try:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from bs4 import BeautifulSoup as _BeautifulSoup, SoupStrainer
+        except ImportError:
+            return False
+        
+        try:
+            import lxml  # noqa: F401 - C-backed parser for BeautifulSoup
+            _HTML_PARSER = 'lxml'
+        except ImportError:
+            pass
+        
+        # Only build tree nodes for the parts of the page we actually read; pages
+        # without main/article fall back to a full parse
+        _CONTENT_STRAINER = SoupStrainer(['title', 'main', 'article'])
+        BeautifulSoup = _BeautifulSoup
+        
+        # Shared HTTP session so TCP/TLS connections are reused across scrapes
+        session = requests.Session()
+        session.headers['User-Agent'] = 'Mozilla/5.0 (compatible; SnowflakeAgent/1.0)'
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=8, max_retries=0)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        _SESSION = session
+    return True
+
+# Only the first 5000 chars of content are used, so cap how much HTML we download
+_MAX_DOWNLOAD_BYTES = 512 * 1024
+_DOWNLOAD_CHUNK_BYTES = 64 * 1024
+
+# Redirects are followed by hand so every hop passes the internal-network check
+_MAX_REDIRECTS = 5
+
+# Tags stripped from extracted content before reading its text
+_NOISE_TAGS = frozenset({'script', 'style', 'nav', 'footer'})
+
+# Single alternation so the text is scanned once for every currency form
+_PRICE_RE = re.compile(r'(?:\$|€|£|USD\s*|EUR\s*)[\d,]+\.?\d*', re.IGNORECASE)
+_CURRENCY_SYMBOLS = ('$', '€', '£')
+
+_ALLOWED_SCHEMES = ('http://', 'https://')
+
+# Internal networks the scraper must never reach (SSRF protection)
+_BLOCKED_NETWORKS = tuple(ipaddress.ip_network(net) for net in (
+    '0.0.0.0/8', '127.0.0.0/8', '10.0.0.0/8', '172.16.0.0/12', '192.168.0.0/16',
+    '169.254.0.0/16', '::1/128', 'fc00::/7', 'fe80::/10'
+))
+
+# getaddrinfo has no timeout of its own, so lookups run on a small pool and are bounded here
+_DNS_TIMEOUT_SECONDS = 5
+_DNS_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix='url-dns')
+
+@lru_cache(maxsize=256)
+def split_url(url: str) -> SplitResult:
+    """Split a URL once and reuse the result across validation and lookups"""
+    return urlsplit(url)
+
+def _is_internal_host(hostname: str) -> bool:
+    """Check whether a hostname is, or resolves to, an internal network address"""
+    if hostname == 'localhost':
+        return True
+    
+    try:
+        addresses = [ipaddress.ip_address(hostname)]
+    except ValueError:
+        # Resolved on every check, never cached, so a host cannot pass once and
+        # later rebind to an internal address
+        lookup = _DNS_EXECUTOR.submit(socket.getaddrinfo, hostname, None)
+        try:
+            infos = lookup.result(timeout=_DNS_TIMEOUT_SECONDS)
+        except (socket.gaierror, UnicodeError):
+            # Unresolvable hosts fail later in the fetch with a clear error
+            return False
+        except FutureTimeoutError:
+            logger.warning(f"DNS lookup timed out for {hostname}")
+            return True
+        addresses = [ipaddress.ip_address(info[4][0].split('%')[0]) for info in infos]
+    
+    # Unwrap IPv4-mapped IPv6 (::ffff:10.0.0.1) so it is checked against the IPv4 ranges
+    addresses = [getattr(address, 'ipv4_mapped', None) or address for address in addresses]
+    return any(address in network for address in addresses for network in _BLOCKED_NETWORKS)
+
 def validate_url(url: str) -> bool:
     """Validate URL format and security"""
-    if not url or not isinstance(url, str):
-        return False
-    
-    if not (url.startswith('http://') or url.startswith('https://')):
+    # String checks first so non-HTTP input never reaches the URL parser
+    if not isinstance(url, str) or not url.startswith(_ALLOWED_SCHEMES):
         return False
     
-    parsed = urlparse(url)
+    parsed = split_url(url)
     if not parsed.netloc:
         return False
     
     # Security: Block internal networks
-    if parsed.hostname in ['localhost', '127.0.0.1'] or (
-        parsed.hostname and parsed.hostname.startswith('192.168.')
-    ):
+    if parsed.hostname and _is_internal_host(parsed.hostname):
         logger.warning(f"Blocked internal URL: {url}")
         return False
     
     return True
 
+def _download(url: str) -> bytes:
+    """Fetch up to _MAX_DOWNLOAD_BYTES of a page, validating every redirect target"""
+    body = bytearray()
+    for _ in range(_MAX_REDIRECTS + 1):
+        with _SESSION.get(url, timeout=30, stream=True, allow_redirects=False) as response:
+            if response.is_redirect:
+                url = urljoin(url, response.headers['Location'])
+                if not validate_url(url):
+                    raise ValueError(f"Redirect to invalid or blocked URL: {url}")
+                continue
+            response.raise_for_status()
+            for chunk in response.iter_content(_DOWNLOAD_CHUNK_BYTES):
+                body += chunk
+                if len(body) >= _MAX_DOWNLOAD_BYTES:
+                    break
+        return bytes(body[:_MAX_DOWNLOAD_BYTES])
+    raise ValueError(f"Too many redirects (more than {_MAX_REDIRECTS})")
+
 def scrape_single_url(url: str) -> Dict[str, Any]:
     """
     Scrape a single URL and return structured data
@@ -51,7 +163,7 @@ def scrape_single_url(url: str) -> Dict[str, Any]:
             'scraped_at': time.strftime('%Y-%m-%dT%H:%M:%SZ')
         }
     
-    if not requests or not BeautifulSoup:
+    if not _load_scraping_deps():
         # Error if dependencies not available - no more mock data
         return {
             'success': False,
@@ -61,26 +173,22 @@ def scrape_single_url(url: str) -> Dict[str, Any]:
         }
     
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (compatible; SnowflakeAgent/1.0)'
-        }
-        
-        response = requests.get(url, headers=headers, timeout=30)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # Remove noise elements
-        for element in soup(['script', 'style', 'nav', 'footer']):
-            element.decompose()
+        html = _download(url)
+        soup = BeautifulSoup(html, _HTML_PARSER, parse_only=_CONTENT_STRAINER)
         
         title = soup.find('title')
-        title_text = title.get_text().strip() if title else urlparse(url).netloc
+        title_text = title.get_text().strip() if title else split_url(url).netloc
         
-        # Get main content
-        main = soup.find('main') or soup.find('article') or soup.body
-        content_text = main.get_text(separator=' ', strip=True) if main else soup.get_text(separator=' ', strip=True)
-        content_text = re.sub(r'\s+', ' ', content_text).strip()
+        # Get main content, stripping noise only from the subtree we extract
+        main = soup.find('main') or soup.find('article')
+        if main is None:
+            # No content landmark: read the whole page body instead
+            soup = BeautifulSoup(html, _HTML_PARSER)
+            main = soup.body or soup
+        for element in main(_NOISE_TAGS):
+            element.decompose()
+        content_text = main.get_text(separator=' ', strip=True)
+        content_text = ' '.join(content_text.split())
         
         # Extract prices for competitive analysis
         prices = extract_prices_from_text(content_text)
@@ -105,24 +213,27 @@ def scrape_single_url(url: str) -> Dict[str, Any]:
 
 def extract_prices_from_text(text: str) -> List[str]:
     """Extract price patterns from text for competitive analysis"""
-    price_patterns = [
-        r'\$[\d,]+\.?\d*',
-        r'€[\d,]+\.?\d*', 
-        r'£[\d,]+\.?\d*',
-        r'USD\s*[\d,]+\.?\d*',
-        r'EUR\s*[\d,]+\.?\d*'
-    ]
+    # Cheap substring prefilter - most feature pages have no prices at all
+    if not any(symbol in text for symbol in _CURRENCY_SYMBOLS):
+        lowered = text.lower()
+        if 'usd' not in lowered and 'eur' not in lowered:
+            return []
     
-    prices = []
-    for pattern in price_patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        prices.extend(matches[:3])  # Limit per pattern
+    prices = _PRICE_RE.findall(text)
     
-    return list(set(prices))[:5]  # Remove duplicates, limit total
+    return list(dict.fromkeys(prices))[:5]  # Remove duplicates (keeping page order), limit total
 
-def create_mock_scrape_result(url: str) -> Dict[str, Any]:
-    """Create realistic mock data for local testing"""
-    domain = urlparse(url).netloc
+# URL shapes for mock competitor suggestions, filled with the primary domain's base name
+_SUGGESTION_TEMPLATES = (
+    "https://competitor1-%s.com",
+    "https://alternative-%s.com",
+    "https://%s-rival.com"
+)
+
+@lru_cache(maxsize=256)
+def _mock_page(url: str) -> Tuple[str, str, Tuple[str, ...]]:
+    """Build the deterministic (title, content, prices) part of a mock scrape once per URL"""
+    domain = split_url(url).netloc
     
     content = f"""
     Welcome to {domain} - Industry leader in business solutions.
@@ -143,22 +254,24 @@ def create_mock_scrape_result(url: str) -> Dict[str, Any]:
     Over 10,000+ customers trust our platform for their business intelligence needs.
     """
     
+    return f"Business Solutions - {domain}", content, tuple(extract_prices_from_text(content))
+
+def create_mock_scrape_result(url: str) -> Dict[str, Any]:
+    """Create realistic mock data for local testing"""
+    title, content, prices = _mock_page(url)
+    
     return {
         'success': True,
         'url': url,
-        'title': f"Business Solutions - {domain}",
+        'title': title,
         'content': content,
-        'prices': extract_prices_from_text(content),
+        'prices': list(prices),
         'scraped_at': time.strftime('%Y-%m-%dT%H:%M:%SZ')
     }
 
 def get_competitor_suggestions(primary_url: str) -> List[str]:
     """Mock competitor suggestions for testing"""
-    domain = urlparse(primary_url).netloc.replace('www.', '')
-    base = domain.split('.')[0]
-    
-    return [
-        f"https://competitor1-{base}.com",
-        f"https://alternative-{base}.com", 
-        f"https://{base}-rival.com"
-    ]
+    domain = split_url(primary_url).netloc.replace('www.', '')
+    base = domain.split('.', 1)[0]
+    
+    return [template % base for template in _SUGGESTION_TEMPLATES]
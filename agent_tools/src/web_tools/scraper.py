@@ -3,13 +3,14 @@ Main web scraper entry point for agents - clean Python, no SQL strings!
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 
 try:
     from snowflake.snowpark import Session
 except ImportError:
     Session = None
-from .core import scrape_single_url, validate_url
+from .core import scrape_single_url
 from .analyzer import get_competitor_suggestions, analyze_competitive_landscape, create_html_report
 
 logger = logging.getLogger(__name__)
@@ -24,26 +25,26 @@ def scrape_website_for_agent(session: Session, url: str) -> str:
     Clean Python code - no more string escaping nightmare!
     """
     try:
-        # Validate URL
-        if not validate_url(url):
-            return create_error_html(url, "Invalid or blocked URL")
-        
         logger.info(f"Starting competitive analysis for: {url}")
         
-        # Step 1: Scrape primary URL
+        # Step 1: Scrape primary URL (validates the URL and reports blocked ones)
         primary_result = scrape_single_url(url)
         if not primary_result['success']:
             return create_error_html(url, primary_result.get('error', 'Scraping failed'))
         
         # Step 2: Get AI competitor suggestions
+        # The two Cortex calls are strictly sequential: suggestions need the primary
+        # content, and the analysis needs the competitor pages scraped from them.
+        # Step 3 is the only stage with independent work, so that is where we overlap.
         competitor_urls = get_competitor_suggestions(session, url, primary_result['content'])
         
-        # Step 3: Scrape competitors (limited to 3 for performance)
+        # Step 3: Scrape competitors concurrently (limited to 3 for performance)
+        competitor_urls = competitor_urls[:3]
+        logger.info(f"Scraping {len(competitor_urls)} competitors: {competitor_urls}")
         competitor_results = []
-        for competitor_url in competitor_urls[:3]:
-            logger.info(f"Scraping competitor: {competitor_url}")
-            result = scrape_single_url(competitor_url)
-            competitor_results.append(result)
+        if competitor_urls:
+            with ThreadPoolExecutor(max_workers=len(competitor_urls)) as executor:
+                competitor_results = list(executor.map(scrape_single_url, competitor_urls))
         
         # Step 4: AI analysis of competitive landscape
         logger.info("Performing AI competitive analysis")
@@ -0,0 +1,8 @@
+"""
+Make the Snowpark handler packages under src/ importable for local tests
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
@@ -0,0 +1,117 @@
+"""
+Tests for the web scraper's internal-network (SSRF) protection
+"""
+
+import socket
+import time
+from unittest import mock
+
+import pytest
+
+from web_tools import core
+
+
+def _resolves_to(*addresses):
+    """Build a getaddrinfo stand-in that returns the given addresses"""
+    def getaddrinfo(host, port, *args, **kwargs):
+        return [(socket.AF_INET6 if ':' in addr else socket.AF_INET, socket.SOCK_STREAM, 0, '', (addr, 0))
+                for addr in addresses]
+    return getaddrinfo
+
+
+@pytest.mark.parametrize("host", [
+    "10.1.2.3",
+    "172.16.0.1",
+    "172.31.255.254",
+    "127.0.0.1",
+    "169.254.169.254",
+    "fd00::1",
+    "fe80::1",
+    "::1",
+    "::ffff:10.0.0.1",
+    "localhost",
+])
+def test_internal_hosts_are_blocked(host):
+    assert core._is_internal_host(host)
+
+
+def test_public_ip_is_allowed():
+    assert not core._is_internal_host("93.184.216.34")
+
+
+def test_public_hostname_is_allowed():
+    with mock.patch.object(core.socket, "getaddrinfo", _resolves_to("93.184.216.34")):
+        assert not core._is_internal_host("public.example")
+
+
+def test_hostname_resolving_to_internal_address_is_blocked():
+    with mock.patch.object(core.socket, "getaddrinfo", _resolves_to("93.184.216.34", "10.0.0.5")):
+        assert core._is_internal_host("mixed.example")
+
+
+def test_unresolvable_host_is_not_blocked():
+    def fail(*args, **kwargs):
+        raise socket.gaierror("Name or service not known")
+    with mock.patch.object(core.socket, "getaddrinfo", fail):
+        assert not core._is_internal_host("does-not-exist.invalid")
+
+
+def test_dns_verdict_is_not_cached():
+    with mock.patch.object(core.socket, "getaddrinfo", _resolves_to("93.184.216.34")):
+        assert not core._is_internal_host("rebind.example")
+    with mock.patch.object(core.socket, "getaddrinfo", _resolves_to("169.254.169.254")):
+        assert core._is_internal_host("rebind.example")
+
+
+def test_dns_timeout_is_blocked():
+    with mock.patch.object(core, "_DNS_TIMEOUT_SECONDS", 0.01), \
+         mock.patch.object(core.socket, "getaddrinfo", lambda *a, **k: time.sleep(0.2)):
+        assert core._is_internal_host("slow.example")
+
+
+@pytest.mark.parametrize("url", [
+    "http://10.0.0.1/admin",
+    "http://[fe80::1]/",
+    "http://localhost:8080/",
+    "ftp://example.com/",
+    "not a url",
+])
+def test_validate_url_rejects_blocked_urls(url):
+    assert not core.validate_url(url)
+
+
+class _Response:
+    def __init__(self, status_code=200, location=None, body=b""):
+        self.status_code = status_code
+        self.headers = {"Location": location} if location else {}
+        self.is_redirect = location is not None
+        self._body = body
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size):
+        yield self._body
+
+
+def test_redirect_to_internal_address_is_refused():
+    session = mock.Mock()
+    session.get.return_value = _Response(302, location="http://169.254.169.254/latest/meta-data/")
+    with mock.patch.object(core, "_SESSION", session):
+        with pytest.raises(ValueError, match="blocked"):
+            core._download("http://93.184.216.34/")
+    assert session.get.call_args.kwargs["allow_redirects"] is False
+
+
+def test_public_redirect_is_followed():
+    session = mock.Mock()
+    session.get.side_effect = [_Response(301, location="/pricing"), _Response(body=b"<main>$10</main>")]
+    with mock.patch.object(core, "_SESSION", session):
+        assert core._download("http://93.184.216.34/") == b"<main>$10</main>"
+    assert session.get.call_args.args[0] == "http://93.184.216.34/pricing"
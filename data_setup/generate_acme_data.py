@@ -9,14 +9,46 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta, date
 import random
-from typing import Dict
+from typing import Dict, Tuple
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from snowflake_connection import SnowflakeConnection
 
+try:
+    from snowflake.connector.version import VERSION as _CONNECTOR_VERSION
+except ImportError:
+    _CONNECTOR_VERSION = (0, 0)
+
+try:
+    from snowflake.snowpark.version import VERSION as _SNOWPARK_VERSION
+except ImportError:
+    _SNOWPARK_VERSION = (0, 0)
+
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# write_pandas only accepts use_vectorized_scanner from connector 3.13 on; older
+# connectors hand the unknown kwarg to to_parquet and the load fails
+_WRITE_PANDAS_OPTIONS = {'use_vectorized_scanner': True} if tuple(_CONNECTOR_VERSION[:2]) >= (3, 13) else {}
+
+# Snowpark sessions are only safe to share across threads from 1.24 on; older
+# versions upload one table at a time. Upload workers x PUT threads caps the
+# number of concurrent file uploads at 16.
+_UPLOAD_WORKERS = 4 if tuple(_SNOWPARK_VERSION[:2]) >= (1, 24) else 1
+_PUT_THREADS = 4
+
+# Revenue and duration lookup tables. Rows/entries follow the key order of the matching
+# weight dictionaries on the generator (company_sizes, subscription_tiers, job_types).
+_BASE_MONTHLY_REVENUE = np.array([
+    [150, 300, 500],     # Small: Basic, Pro, Enterprise
+    [400, 800, 1200],    # Medium
+    [800, 1500, 2500]    # Large
+], dtype=np.float64)
+_TIER_MULTIPLIER = np.array([1.0, 1.3, 1.6])                 # Basic, Pro, Enterprise
+_JOB_BASE_REVENUE = np.array([800.0, 300.0, 200.0, 500.0])   # Installation, Repair, Maintenance, Emergency
+_JOB_BASE_DURATION = np.array([4.0, 2.0, 1.5, 3.0])
+
 class ACMEServicesDataGenerator:
     """Generates realistic ACME Services data for the intelligence demo with financial contract data"""
     
@@ -28,7 +60,10 @@ class ACMEServicesDataGenerator:
         self.end_date = datetime.strptime(end_date, '%Y-%m-%d').date()
         
         # Demo narrative elements - these are the "problem" technicians
-        self.underperforming_technicians = ['TECH_015', 'TECH_023']
+        self.underperforming_technicians = frozenset({'TECH_015', 'TECH_023'})
+        
+        # Cached (items, cdf) arrays for the weighted distributions below
+        self._distributions = {}
         
         # Seed for reproducible results
         random.seed(42)
@@ -156,17 +191,47 @@ class ACMEServicesDataGenerator:
                       'San Diego', 'Dallas', 'San Jose', 'Austin', 'Jacksonville',
                       'Fort Worth', 'Columbus', 'Charlotte', 'San Francisco', 'Indianapolis']
     
+    def _distribution(self, choices: Dict[str, float]) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the (items, cumulative weights) arrays for a dictionary of options, built once per distribution"""
+        key = tuple(choices.items())
+        distribution = self._distributions.get(key)
+        if distribution is None:
+            cdf = np.cumsum(list(choices.values()))
+            distribution = (np.array(list(choices.keys())), cdf / cdf[-1])
+            self._distributions[key] = distribution
+        return distribution
+    
+    def _codes(self, choices: Dict[str, float], values) -> np.ndarray:
+        """Map values to their integer position among the keys of a weight dictionary"""
+        codes = pd.Index(list(choices.keys())).get_indexer(values)
+        if (codes < 0).any():
+            unknown = sorted({str(value) for value, code in zip(values, codes) if code < 0})
+            raise ValueError(f"Unknown values for weight dictionary: {unknown}")
+        return codes
+    
     def _weighted_choice(self, choices: Dict[str, float]) -> str:
         """Make a weighted random choice from a dictionary of options"""
-        items = list(choices.keys())
-        weights = list(choices.values())
-        return np.random.choice(items, p=weights)
+        items, cdf = self._distribution(choices)
+        return items[np.searchsorted(cdf, random.random(), side='right')]
+    
+    def _weighted_choices(self, choices: Dict[str, float], size: int) -> np.ndarray:
+        """Make `size` weighted random choices at once from a dictionary of options"""
+        items, cdf = self._distribution(choices)
+        return items[np.searchsorted(cdf, np.random.random(size), side='right')]
+    
+    def _weighted_choice_columns(self, columns: Dict[str, Dict[str, float]], size: int) -> Dict[str, np.ndarray]:
+        """Draw several weighted categorical columns of `size` rows from a single block of uniforms"""
+        uniforms = np.random.random((len(columns), size))
+        draws = {}
+        for u, (name, choices) in zip(uniforms, columns.items()):
+            items, cdf = self._distribution(choices)
+            draws[name] = items[np.searchsorted(cdf, u, side='right')]
+        return draws
     
     def generate_customers(self) -> pd.DataFrame:
         """Generate customer companies using ACME Services"""
         logger.info(f"Generating {self.num_customers} customer companies...")
         
-        customers = []
         company_names = [
             "Comfort Zone HVAC", "Premier Plumbing Solutions", "Elite Electric Services",
             "Reliable Roofing Co", "Quick Fix Plumbing", "Arctic Air Conditioning",
@@ -187,48 +252,39 @@ class ACMEServicesDataGenerator:
             "Cool Solutions", "Pipe Patrol", "Voltage Vanguard"
         ]
         
-        for i in range(self.num_customers):
-            customer_id = f"CUST_{str(i+1).zfill(3)}"
-            industry = self._weighted_choice(self.industries)
-            company_size = self._weighted_choice(self.company_sizes)
-            tier = self._weighted_choice(self.subscription_tiers)
-            
-            # Set monthly revenue based on size and tier
-            base_revenue = {
-                'Small': {'Basic': 150, 'Pro': 300, 'Enterprise': 500},
-                'Medium': {'Basic': 400, 'Pro': 800, 'Enterprise': 1200},
-                'Large': {'Basic': 800, 'Pro': 1500, 'Enterprise': 2500}
-            }
-            
-            monthly_revenue = base_revenue[company_size][tier] * np.random.uniform(0.8, 1.2)
-            
-            # Generate signup date (mostly in 2024, some in 2023)
-            if random.random() < 0.8:
-                signup_start = datetime(2024, 1, 1).date()
-                signup_end = datetime(2024, 12, 31).date()
-            else:
-                signup_start = datetime(2023, 1, 1).date()
-                signup_end = datetime(2023, 12, 31).date()
-                
-            signup_date = signup_start + timedelta(
-                days=random.randint(0, (signup_end - signup_start).days)
-            )
-            
-            customer = {
-                'customer_id': customer_id,
-                'company_name': company_names[i] if i < len(company_names) else f"ServiceCo {i+1}",
-                'industry': industry,
-                'company_size': company_size,
-                'location_state': random.choice(self.states),
-                'location_city': random.choice(self.cities),
-                'signup_date': signup_date,
-                'subscription_tier': tier,
-                'monthly_revenue': round(monthly_revenue, 2),
-                'created_at': datetime.now(),
-                'updated_at': datetime.now()
-            }
-            
-            customers.append(customer)
+        n = self.num_customers
+        draws = self._weighted_choice_columns({
+            'industry': self.industries,
+            'company_size': self.company_sizes,
+            'subscription_tier': self.subscription_tiers
+        }, n)
+        industry, company_size, tier = draws['industry'], draws['company_size'], draws['subscription_tier']
+        
+        # Set monthly revenue based on size and tier
+        size_idx = self._codes(self.company_sizes, company_size)
+        tier_idx = self._codes(self.subscription_tiers, tier)
+        monthly_revenue = _BASE_MONTHLY_REVENUE[size_idx, tier_idx] * np.random.uniform(0.8, 1.2, n)
+        
+        # Generate signup date (mostly in 2024, some in 2023)
+        is_2024 = np.random.random(n) < 0.8
+        signup_start = np.where(is_2024, np.datetime64('2024-01-01'), np.datetime64('2023-01-01'))
+        signup_days = np.random.randint(0, np.where(is_2024, 366, 365))
+        signup_date = pd.DatetimeIndex(signup_start + signup_days.astype('timedelta64[D]')).date
+        
+        now = datetime.now()
+        customers = {
+            'customer_id': [f"CUST_{str(i+1).zfill(3)}" for i in range(n)],
+            'company_name': [company_names[i] if i < len(company_names) else f"ServiceCo {i+1}" for i in range(n)],
+            'industry': industry,
+            'company_size': company_size,
+            'location_state': np.random.choice(self.states, n),
+            'location_city': np.random.choice(self.cities, n),
+            'signup_date': signup_date,
+            'subscription_tier': tier,
+            'monthly_revenue': np.round(monthly_revenue, 2),
+            'created_at': now,
+            'updated_at': now
+        }
         
         return pd.DataFrame(customers)
     
@@ -246,67 +302,50 @@ class ACMEServicesDataGenerator:
                      'Thomas', 'Taylor', 'Moore', 'Jackson', 'Martin', 'Lee', 'Perez', 'Thompson',
                      'White', 'Harris', 'Sanchez', 'Clark', 'Ramirez', 'Lewis', 'Robinson']
         
-        technicians = []
+        n = self.num_technicians
+        tech_ids = np.array([f"TECH_{str(i+1).zfill(3)}" for i in range(n)])
+        now = datetime.now()
+        today = np.datetime64(now.date())
         
-        for i in range(self.num_technicians):
-            tech_id = f"TECH_{str(i+1).zfill(3)}"
-            
-            # Assign to random customer
-            customer_id = random.choice(customers_df['customer_id'].tolist())
-            customer_industry = customers_df[customers_df['customer_id'] == customer_id]['industry'].iloc[0]
-            
-            # Specialization usually matches customer industry
-            if random.random() < 0.8:
-                specialization = customer_industry
-            else:
-                specialization = random.choice(list(self.industries.keys()))
-            
-            # Generate hire date (mostly recent hires, some veterans)
-            if random.random() < 0.6:
-                # Recent hires (last 2 years)
-                hire_start = datetime(2023, 1, 1).date()
-                hire_end = datetime(2024, 12, 31).date()
-            else:
-                # Veterans (2-10 years ago)
-                hire_start = datetime(2015, 1, 1).date()
-                hire_end = datetime(2022, 12, 31).date()
-            
-            hire_date = hire_start + timedelta(
-                days=random.randint(0, (hire_end - hire_start).days)
-            )
-            
-            years_experience = (datetime.now().date() - hire_date).days / 365.25
-            
-            # Certification level based on experience
-            if years_experience < 1:
-                cert_level = 'Junior'
-            elif years_experience < 5:
-                cert_level = 'Senior' 
-            else:
-                cert_level = 'Expert'
-            
-            # Special handling for underperforming technicians
-            if tech_id in self.underperforming_technicians:
-                # Make them newer hires with less experience
-                hire_date = datetime(2024, 6, 1).date() + timedelta(days=random.randint(0, 120))
-                years_experience = (datetime.now().date() - hire_date).days / 365.25
-                cert_level = 'Junior'
-            
-            technician = {
-                'technician_id': tech_id,
-                'customer_id': customer_id,
-                'first_name': random.choice(first_names),
-                'last_name': random.choice(last_names),
-                'hire_date': hire_date,
-                'specialization': specialization,
-                'certification_level': cert_level,
-                'years_experience': round(years_experience, 1),
-                'is_active': True,
-                'created_at': datetime.now(),
-                'updated_at': datetime.now()
-            }
-            
-            technicians.append(technician)
+        # Assign to random customers
+        customer_id = np.random.choice(customers_df['customer_id'].to_numpy(), n)
+        customer_industry = customers_df.set_index('customer_id')['industry'].loc[customer_id].to_numpy()
+        
+        # Specialization usually matches customer industry
+        specialization = np.where(
+            np.random.random(n) < 0.8, customer_industry, np.random.choice(list(self.industries.keys()), n)
+        )
+        
+        # Generate hire date (mostly recent hires in the last 2 years, some 2-10 year veterans)
+        is_recent = np.random.random(n) < 0.6
+        hire_start = np.where(is_recent, np.datetime64('2023-01-01'), np.datetime64('2015-01-01'))
+        hire_end = np.where(is_recent, np.datetime64('2024-12-31'), np.datetime64('2022-12-31'))
+        hire_date = hire_start + np.random.randint(0, (hire_end - hire_start).astype(int) + 1).astype('timedelta64[D]')
+        
+        # Special handling for underperforming technicians: make them newer hires with less experience
+        is_underperformer = np.isin(tech_ids, list(self.underperforming_technicians))
+        newer_hire_date = np.datetime64('2024-06-01') + np.random.randint(0, 121, n).astype('timedelta64[D]')
+        hire_date = np.where(is_underperformer, newer_hire_date, hire_date)
+        
+        years_experience = (today - hire_date).astype(int) / 365.25
+        
+        # Certification level based on experience
+        cert_level = np.select([years_experience < 1, years_experience < 5], ['Junior', 'Senior'], default='Expert')
+        cert_level[is_underperformer] = 'Junior'
+        
+        technicians = {
+            'technician_id': tech_ids,
+            'customer_id': customer_id,
+            'first_name': np.random.choice(first_names, n),
+            'last_name': np.random.choice(last_names, n),
+            'hire_date': pd.DatetimeIndex(hire_date).date,
+            'specialization': specialization,
+            'certification_level': cert_level,
+            'years_experience': np.round(years_experience, 1),
+            'is_active': True,
+            'created_at': now,
+            'updated_at': now
+        }
         
         return pd.DataFrame(technicians)
     
@@ -316,81 +355,66 @@ class ACMEServicesDataGenerator:
         
         # Generate more jobs for the demo (about 20-30 jobs per technician)
         total_jobs = self.num_technicians * random.randint(20, 30)
-        jobs = []
+        now = datetime.now()
+        
+        # Pick random technicians and their customers
+        tech_idx = np.random.randint(0, len(technicians_df), total_jobs)
+        technician_id = technicians_df['technician_id'].to_numpy()[tech_idx]
+        customer_id = technicians_df['customer_id'].to_numpy()[tech_idx]
+        specialization = technicians_df['specialization'].to_numpy()[tech_idx]
+        customer_info = customers_df.set_index('customer_id').loc[customer_id]
+        
+        job_type = self._weighted_choices(self.job_types, total_jobs)
+        
+        # Generate scheduled date (spread across our date range)
+        days_range = (self.end_date - self.start_date).days
+        scheduled = np.datetime64(self.start_date) + np.random.randint(0, days_range + 1, total_jobs).astype('timedelta64[D]')
+        
+        # Most jobs are completed (90%), some are in progress or cancelled
+        status_weights = {'Completed': 0.90, 'In Progress': 0.05, 'Cancelled': 0.05}
+        job_status = self._weighted_choices(status_weights, total_jobs).astype(object)
+        
+        # Completed date (if completed), usually within 1-3 days of scheduling
+        completed = scheduled + np.random.randint(0, 4, total_jobs).astype('timedelta64[D]')
+        is_completed = job_status == 'Completed'
+        # Don't complete jobs in the future
+        in_future = is_completed & (completed > np.datetime64(now.date()))
+        job_status[in_future] = 'Scheduled'
+        completed_date = np.where(is_completed & ~in_future, pd.DatetimeIndex(completed).date, None)
+        
+        # Job revenue based on type and customer tier
+        job_type_idx = self._codes(self.job_types, job_type)
+        tier_idx = self._codes(self.subscription_tiers, customer_info['subscription_tier'])
+        job_revenue = _JOB_BASE_REVENUE[job_type_idx] * _TIER_MULTIPLIER[tier_idx] * np.random.uniform(0.7, 1.5, total_jobs)
+        
+        # Duration based on job type
+        job_duration = _JOB_BASE_DURATION[job_type_idx] * np.random.uniform(0.5, 1.8, total_jobs)
+        
+        # Service address
+        house_numbers = np.random.randint(100, 10000, total_jobs)
+        streets = np.random.choice(['Main St', 'Oak Ave', 'Elm Dr', 'Pine Rd', 'Cedar Ln'], total_jobs)
+        service_address = [
+            f"{number} {street}, {city}, {state}"
+            for number, street, city, state in zip(
+                house_numbers, streets, customer_info['location_city'], customer_info['location_state']
+            )
+        ]
         
-        for i in range(total_jobs):
-            job_id = f"JOB_{str(i+1).zfill(5)}"
-            
-            # Pick random technician and their customer
-            technician = technicians_df.sample(1).iloc[0]
-            technician_id = technician['technician_id']
-            customer_id = technician['customer_id']
-            
-            job_type = self._weighted_choice(self.job_types)
-            
-            # Generate scheduled date (spread across our date range)
-            days_range = (self.end_date - self.start_date).days
-            scheduled_date = self.start_date + timedelta(days=random.randint(0, days_range))
-            
-            # Most jobs are completed (90%), some are in progress or cancelled
-            status_weights = {'Completed': 0.90, 'In Progress': 0.05, 'Cancelled': 0.05}
-            job_status = self._weighted_choice(status_weights)
-            
-            # Completed date (if completed)
-            completed_date = None
-            if job_status == 'Completed':
-                # Usually completed within 1-3 days of scheduling
-                completed_date = scheduled_date + timedelta(days=random.randint(0, 3))
-                # Don't complete jobs in the future
-                if completed_date > datetime.now().date():
-                    completed_date = None
-                    job_status = 'Scheduled'
-            
-            # Job revenue based on type and customer tier
-            customer_info = customers_df[customers_df['customer_id'] == customer_id].iloc[0]
-            tier_multiplier = {'Basic': 1.0, 'Pro': 1.3, 'Enterprise': 1.6}[customer_info['subscription_tier']]
-            
-            base_revenue = {
-                'Installation': 800,
-                'Repair': 300,
-                'Maintenance': 200,
-                'Emergency': 500
-            }
-            
-            job_revenue = base_revenue[job_type] * tier_multiplier * np.random.uniform(0.7, 1.5)
-            
-            # Duration based on job type
-            base_duration = {
-                'Installation': 4.0,
-                'Repair': 2.0,
-                'Maintenance': 1.5,
-                'Emergency': 3.0
-            }
-            
-            job_duration = base_duration[job_type] * np.random.uniform(0.5, 1.8)
-            
-            # Service address
-            service_address = f"{random.randint(100, 9999)} {random.choice(['Main St', 'Oak Ave', 'Elm Dr', 'Pine Rd', 'Cedar Ln'])}, {customer_info['location_city']}, {customer_info['location_state']}"
-            
-            job_description = f"{job_type} service for {technician['specialization']} system"
-            
-            job = {
-                'job_id': job_id,
-                'customer_id': customer_id,
-                'technician_id': technician_id,
-                'job_type': job_type,
-                'job_status': job_status,
-                'scheduled_date': scheduled_date,
-                'completed_date': completed_date,
-                'job_revenue': round(job_revenue, 2),
-                'job_duration_hours': round(job_duration, 2),
-                'service_address': service_address,
-                'job_description': job_description,
-                'created_at': datetime.now(),
-                'updated_at': datetime.now()
-            }
-            
-            jobs.append(job)
+        jobs = {
+            'job_id': [f"JOB_{str(i+1).zfill(5)}" for i in range(total_jobs)],
+            'customer_id': customer_id,
+            'technician_id': technician_id,
+            'job_type': job_type,
+            'job_status': job_status,
+            'scheduled_date': pd.DatetimeIndex(scheduled).date,
+            'completed_date': completed_date,
+            'job_revenue': np.round(job_revenue, 2),
+            'job_duration_hours': np.round(job_duration, 2),
+            'service_address': service_address,
+            'job_description': [f"{jt} service for {spec} system" for jt, spec in zip(job_type, specialization)],
+            'created_at': now,
+            'updated_at': now
+        }
         
         return pd.DataFrame(jobs)
     
@@ -402,8 +426,8 @@ class ACMEServicesDataGenerator:
         # Only generate reviews for completed jobs (about 60% get reviews)
         completed_jobs = jobs_df[jobs_df['job_status'] == 'Completed'].copy()
         review_jobs = completed_jobs.sample(frac=0.6)
-        
-        reviews = []
+        # Skip jobs without a completion date
+        review_jobs = review_jobs[review_jobs['completed_date'].notna()]
         
         # Positive review templates
         positive_reviews = [
@@ -433,58 +457,45 @@ class ACMEServicesDataGenerator:
             "Charged for parts that weren't needed and work was substandard."
         ]
         
-        for _, job in review_jobs.iterrows():
-            review_id = f"REV_{len(reviews)+1:05d}"
-            
-            # Determine if this is an underperforming technician
-            is_underperformer = job['technician_id'] in self.underperforming_technicians
-            
-            # Generate rating based on technician performance
-            if is_underperformer:
-                # Underperformers get mostly 1-2 star reviews (80% bad, 20% mediocre)
-                if random.random() < 0.8:
-                    rating = random.choice([1, 2])
-                    review_text = random.choice(negative_reviews)
-                else:
-                    rating = 3
-                    review_text = "Service was okay but could have been better."
-            else:
-                # Normal technicians get mostly good reviews
-                rating_weights = {5: 0.5, 4: 0.3, 3: 0.15, 2: 0.04, 1: 0.01}
-                rating = self._weighted_choice(rating_weights)
-                
-                if rating >= 4:
-                    review_text = random.choice(positive_reviews)
-                elif rating == 3:
-                    review_text = "Service was adequate, met expectations."
-                else:
-                    review_text = random.choice(negative_reviews)
-            
-            # Review date is usually within a few days of job completion
-            if job['completed_date']:
-                review_date = job['completed_date'] + timedelta(days=random.randint(0, 7))
-                # Don't create reviews in the future
-                if review_date > datetime.now().date():
-                    review_date = datetime.now().date()
-            else:
-                continue  # Skip if no completion date
-            
-            review_source = self._weighted_choice(self.review_sources)
-            
-            review = {
-                'review_id': review_id,
-                'job_id': job['job_id'],
-                'customer_id': job['customer_id'],
-                'technician_id': job['technician_id'],
-                'rating': rating,
-                'review_text': review_text,
-                'review_source': review_source,
-                'review_date': review_date,
-                'is_verified': random.choice([True, False]),
-                'created_at': datetime.now()
-            }
-            
-            reviews.append(review)
+        # Draw ratings and review text for every candidate review up front
+        n = len(review_jobs)
+        is_underperformer = review_jobs['technician_id'].isin(self.underperforming_technicians).to_numpy()
+        
+        # Underperformers get mostly 1-2 star reviews (80% bad, 20% mediocre)
+        underperformer_ratings = np.where(np.random.random(n) < 0.8, np.random.randint(1, 3, n), 3)
+        # Normal technicians get mostly good reviews
+        rating_weights = {5: 0.5, 4: 0.3, 3: 0.15, 2: 0.04, 1: 0.01}
+        ratings = np.where(is_underperformer, underperformer_ratings, self._weighted_choices(rating_weights, n))
+        
+        review_texts = np.select(
+            [ratings >= 4, (ratings == 3) & is_underperformer, ratings == 3],
+            [np.random.choice(np.array(positive_reviews, dtype=object), n),
+             "Service was okay but could have been better.",
+             "Service was adequate, met expectations."],
+            default=np.random.choice(np.array(negative_reviews, dtype=object), n)
+        )
+        review_sources = self._weighted_choices(self.review_sources, n)
+        now = datetime.now()
+        today = now.date()
+        
+        # Review date is usually within a few days of job completion
+        completed_date = pd.to_datetime(review_jobs['completed_date']).to_numpy().astype('datetime64[D]')
+        review_date = completed_date + np.random.randint(0, 8, n).astype('timedelta64[D]')
+        # Don't create reviews in the future
+        review_date = np.minimum(review_date, np.datetime64(today))
+        
+        reviews = {
+            'review_id': [f"REV_{i+1:05d}" for i in range(n)],
+            'job_id': review_jobs['job_id'].to_numpy(),
+            'customer_id': review_jobs['customer_id'].to_numpy(),
+            'technician_id': review_jobs['technician_id'].to_numpy(),
+            'rating': ratings,
+            'review_text': review_texts,
+            'review_source': review_sources,
+            'review_date': pd.DatetimeIndex(review_date).date,
+            'is_verified': np.random.random(n) < 0.5,
+            'created_at': now
+        }
         
         return pd.DataFrame(reviews)
     
@@ -512,226 +523,65 @@ class ACMEServicesDataGenerator:
             logger.info("Setting up financial data tables...")
             self._create_financial_tables(conn)
             
-            # Clear existing data safely (only if tables exist)
-            logger.info("Clearing existing data...")
-            self._safe_clear_tables(conn, [
-                "REVIEWS", "JOBS", "TECHNICIANS", "CUSTOMERS",
-                "BILLING_METRICS", "CUSTOMER_SEGMENTS", "TENANT_HIERARCHY",
-                "PRODUCTS", "ACCOUNTS", "OPPORTUNITIES", "CONTRACTS", 
-                "ORDERS", "ORDER_ITEMS", "INVOICES", "ACME_BILLING_DATA",
-                "PARENT_CHILD_MAPPING", "TENANT_SFDC_MAPPING"
-            ])
-            
-            # Load customers
-            logger.info(f"Loading {len(customers_df)} customers...")
-            # Convert column names to uppercase for Snowflake
-            customers_df.columns = customers_df.columns.str.upper()
-            conn.session.write_pandas(
-                customers_df, 
-                table_name="CUSTOMERS",
-                auto_create_table=False,
-                overwrite=False
-            )
-            
-            # Load technicians
-            logger.info(f"Loading {len(technicians_df)} technicians...")
-            technicians_df.columns = technicians_df.columns.str.upper()
-            conn.session.write_pandas(
-                technicians_df,
-                table_name="TECHNICIANS", 
-                auto_create_table=False,
-                overwrite=False
-            )
-            
-            # Load jobs
-            logger.info(f"Loading {len(jobs_df)} jobs...")
-            jobs_df.columns = jobs_df.columns.str.upper()
-            conn.session.write_pandas(
-                jobs_df,
-                table_name="JOBS",
-                auto_create_table=False,
-                overwrite=False
-            )
-            
-            # Load reviews
-            logger.info(f"Loading {len(reviews_df)} reviews...")
-            reviews_df.columns = reviews_df.columns.str.upper()
-            conn.session.write_pandas(
-                reviews_df,
-                table_name="REVIEWS",
-                auto_create_table=False,
-                overwrite=False
-            )
-            
-            # Load NDR data
-            logger.info(f"Loading {len(tenant_hierarchy_df)} tenant hierarchy records...")
-            tenant_hierarchy_df.columns = tenant_hierarchy_df.columns.str.upper()
-            conn.session.write_pandas(
-                tenant_hierarchy_df,
-                table_name="TENANT_HIERARCHY",
-                auto_create_table=False,
-                overwrite=False
-            )
-            
-            logger.info(f"Loading {len(customer_segments_df)} customer segments...")
-            customer_segments_df.columns = customer_segments_df.columns.str.upper()
-            conn.session.write_pandas(
-                customer_segments_df,
-                table_name="CUSTOMER_SEGMENTS",
-                auto_create_table=False,
-                overwrite=False
-            )
-            
-            logger.info(f"Loading {len(billing_metrics_df)} billing metrics...")
-            billing_metrics_df.columns = billing_metrics_df.columns.str.upper()
-            conn.session.write_pandas(
-                billing_metrics_df,
-                table_name="BILLING_METRICS",
-                auto_create_table=False,
-                overwrite=False
-            )
-            
-            # Load new financial data
-            logger.info(f"Loading {len(sf_products_df)} products...")
-            sf_products_df.columns = sf_products_df.columns.str.upper()
-            conn.session.write_pandas(
-                sf_products_df,
-                table_name="PRODUCTS",
-                auto_create_table=False,
-                overwrite=False
-            )
-            
-            logger.info(f"Loading {len(sf_accounts_df)} accounts...")
-            sf_accounts_df.columns = sf_accounts_df.columns.str.upper()
-            conn.session.write_pandas(
-                sf_accounts_df,
-                table_name="ACCOUNTS",
-                auto_create_table=False,
-                overwrite=False
-            )
-            
-            logger.info(f"Loading {len(opportunities_df)} opportunities...")
-            opportunities_df.columns = opportunities_df.columns.str.upper()
-            conn.session.write_pandas(
-                opportunities_df,
-                table_name="OPPORTUNITIES",
-                auto_create_table=False,
-                overwrite=False
-            )
-            
-            logger.info(f"Loading {len(contracts_df)} contracts...")
-            contracts_df.columns = contracts_df.columns.str.upper()
-            conn.session.write_pandas(
-                contracts_df,
-                table_name="CONTRACTS",
-                auto_create_table=False,
-                overwrite=False
-            )
-            
-            logger.info(f"Loading {len(orders_df)} orders...")
-            orders_df.columns = orders_df.columns.str.upper()
-            conn.session.write_pandas(
-                orders_df,
-                table_name="ORDERS",
-                auto_create_table=False,
-                overwrite=False
-            )
-            
-            logger.info(f"Loading {len(order_items_df)} order items...")
-            order_items_df.columns = order_items_df.columns.str.upper()
-            conn.session.write_pandas(
-                order_items_df,
-                table_name="ORDER_ITEMS",
-                auto_create_table=False,
-                overwrite=False
-            )
-            
-            if not sf_invoices_df.empty:
-                logger.info(f"Loading {len(sf_invoices_df)} SFDC invoices...")
-                sf_invoices_df.columns = sf_invoices_df.columns.str.upper()
-                conn.session.write_pandas(
-                    sf_invoices_df,
-                    table_name="INVOICES",
-                    auto_create_table=False,
-                    overwrite=False
-                )
-            
-            logger.info(f"Loading {len(st_billing_df)} ACME Platform billing records...")
-            st_billing_df.columns = st_billing_df.columns.str.upper()
-            conn.session.write_pandas(
-                st_billing_df,
-                table_name="ACME_BILLING_DATA",
-                auto_create_table=False,
-                overwrite=False
-            )
-            
-            logger.info(f"Loading {len(parent_child_mapping_df)} parent-child mappings...")
-            parent_child_mapping_df.columns = parent_child_mapping_df.columns.str.upper()
-            conn.session.write_pandas(
-                parent_child_mapping_df,
-                table_name="PARENT_CHILD_MAPPING",
-                auto_create_table=False,
-                overwrite=False
-            )
-            
-            logger.info(f"Loading {len(tenant_sfdc_mapping_df)} tenant-SFDC mappings...")
-            tenant_sfdc_mapping_df.columns = tenant_sfdc_mapping_df.columns.str.upper()
-            conn.session.write_pandas(
-                tenant_sfdc_mapping_df,
-                table_name="TENANT_SFDC_MAPPING",
-                auto_create_table=False,
-                overwrite=False
-            )
-            
-            # Load document content
-            logger.info(f"Loading {len(documents_df)} document(s)...")
-            documents_df.columns = documents_df.columns.str.upper()
-            conn.session.write_pandas(
-                documents_df,
-                table_name="STG_PARSED_DOCUMENTS",
-                auto_create_table=False,
-                overwrite=False
-            )
+            tables = [
+                (customers_df, "CUSTOMERS", "customers"),
+                (technicians_df, "TECHNICIANS", "technicians"),
+                (jobs_df, "JOBS", "jobs"),
+                (reviews_df, "REVIEWS", "reviews"),
+                # NDR data
+                (tenant_hierarchy_df, "TENANT_HIERARCHY", "tenant hierarchy records"),
+                (customer_segments_df, "CUSTOMER_SEGMENTS", "customer segments"),
+                (billing_metrics_df, "BILLING_METRICS", "billing metrics"),
+                # Financial data
+                (sf_products_df, "PRODUCTS", "products"),
+                (sf_accounts_df, "ACCOUNTS", "accounts"),
+                (opportunities_df, "OPPORTUNITIES", "opportunities"),
+                (contracts_df, "CONTRACTS", "contracts"),
+                (orders_df, "ORDERS", "orders"),
+                (order_items_df, "ORDER_ITEMS", "order items"),
+                (sf_invoices_df, "INVOICES", "SFDC invoices"),
+                (st_billing_df, "ACME_BILLING_DATA", "ACME Platform billing records"),
+                (parent_child_mapping_df, "PARENT_CHILD_MAPPING", "parent-child mappings"),
+                (tenant_sfdc_mapping_df, "TENANT_SFDC_MAPPING", "tenant-SFDC mappings"),
+                # Document content
+                (documents_df, "STG_PARSED_DOCUMENTS", "document(s)")
+            ]
+            
+            # Every table except the parsed documents is replaced on each run. write_pandas
+            # truncates those as part of the load, so only tables with no new rows need clearing.
+            empty_tables = [table_name for df, table_name, _ in tables
+                            if df.empty and table_name != "STG_PARSED_DOCUMENTS"]
+            if empty_tables:
+                logger.info("Clearing existing data...")
+                self._safe_clear_tables(conn, empty_tables)
+            
+            # Each upload is a network-bound PUT + COPY, so run them concurrently
+            with ThreadPoolExecutor(max_workers=_UPLOAD_WORKERS) as executor:
+                uploads = []
+                for df, table_name, label in tables:
+                    if df.empty:
+                        continue
+                    logger.info(f"Loading {len(df)} {label}...")
+                    overwrite = table_name != "STG_PARSED_DOCUMENTS"
+                    uploads.append((table_name, executor.submit(self._load_table, conn, df, table_name, overwrite)))
+                for table_name, upload in uploads:
+                    try:
+                        upload.result()
+                    except Exception as e:
+                        logger.error(f"Failed to load {table_name}: {str(e)} "
+                                     "(tables already replaced keep their new rows; rerun to reload consistently)")
+                        raise
             
             # Verify data load
             logger.info("Verifying data load...")
-            results = conn.fetch("""
-                SELECT 
-                    'CUSTOMERS' as table_name, COUNT(*) as row_count FROM CUSTOMERS
-                UNION ALL
-                SELECT 'TECHNICIANS', COUNT(*) FROM TECHNICIANS  
-                UNION ALL
-                SELECT 'JOBS', COUNT(*) FROM JOBS
-                UNION ALL
-                SELECT 'REVIEWS', COUNT(*) FROM REVIEWS
-                UNION ALL
-                SELECT 'TENANT_HIERARCHY', COUNT(*) FROM TENANT_HIERARCHY
-                UNION ALL
-                SELECT 'CUSTOMER_SEGMENTS', COUNT(*) FROM CUSTOMER_SEGMENTS
-                UNION ALL
-                SELECT 'BILLING_METRICS', COUNT(*) FROM BILLING_METRICS
-                UNION ALL
-                SELECT 'PRODUCTS', COUNT(*) FROM PRODUCTS
-                UNION ALL
-                SELECT 'ACCOUNTS', COUNT(*) FROM ACCOUNTS
-                UNION ALL
-                SELECT 'OPPORTUNITIES', COUNT(*) FROM OPPORTUNITIES
-                UNION ALL
-                SELECT 'CONTRACTS', COUNT(*) FROM CONTRACTS
-                UNION ALL
-                SELECT 'ORDERS', COUNT(*) FROM ORDERS
-                UNION ALL
-                SELECT 'ORDER_ITEMS', COUNT(*) FROM ORDER_ITEMS
-                UNION ALL
-                SELECT 'INVOICES', COUNT(*) FROM INVOICES
-                UNION ALL
-                SELECT 'ACME_BILLING_DATA', COUNT(*) FROM ACME_BILLING_DATA
-                UNION ALL
-                SELECT 'PARENT_CHILD_MAPPING', COUNT(*) FROM PARENT_CHILD_MAPPING
-                UNION ALL
-                SELECT 'TENANT_SFDC_MAPPING', COUNT(*) FROM TENANT_SFDC_MAPPING
-                UNION ALL
-                SELECT 'STG_PARSED_DOCUMENTS', COUNT(*) FROM STG_PARSED_DOCUMENTS
+            # Row counts come from table metadata, so no table is scanned
+            table_names = ", ".join(f"'{table_name}'" for _, table_name, _ in tables)
+            results = conn.fetch(f"""
+                SELECT table_name, row_count
+                FROM INFORMATION_SCHEMA.TABLES
+                WHERE table_schema = CURRENT_SCHEMA()
+                  AND table_name IN ({table_names})
+                ORDER BY table_name
             """)
             
             for result in results:
@@ -744,6 +594,26 @@ class ACMEServicesDataGenerator:
             logger.error(f"Error loading data to Snowflake: {str(e)}")
             raise
     
+    def _load_table(self, conn: SnowflakeConnection, df: pd.DataFrame, table_name: str,
+                    overwrite: bool = False):
+        """Upload a DataFrame into an existing table in the current schema, optionally replacing its rows"""
+        # write_pandas stages the frame as Parquet, PUTs it and runs COPY INTO;
+        # snappy is much cheaper to compress and decompress than the gzip default.
+        # Unquoted identifiers let Snowflake resolve our lowercase column names to
+        # the uppercase table columns, so the frame is uploaded as-is.
+        # With auto_create_table=False, overwrite=True truncates the table instead of dropping it.
+        # The vectorized Parquet scanner speeds up the COPY side of the load when the connector supports it.
+        conn.session.write_pandas(
+            df,
+            table_name=table_name,
+            auto_create_table=False,
+            overwrite=overwrite,
+            compression='snappy',
+            quote_identifiers=False,
+            parallel=_PUT_THREADS,
+            **_WRITE_PANDAS_OPTIONS
+        )
+    
     def generate_tenant_hierarchy(self) -> pd.DataFrame:
         """Generate parent-child account relationships for NDR calculations"""
         logger.info("Generating tenant hierarchy...")
@@ -785,15 +655,13 @@ class ACMEServicesDataGenerator:
         # Get all unique account IDs
         all_accounts = list(hierarchy_df['parent_account_id'].unique())
         
-        segments = []
-        for account_id in all_accounts:
-            segments.append({
-                'parent_account_id': account_id,
-                'size_segment': self._weighted_choice(self.size_segments),
-                'market_segment': self._weighted_choice(self.market_segments),
-                'trade_segment': self._weighted_choice(self.trade_segments),
-                'product_category': self._weighted_choice(self.product_categories)
-            })
+        segments = {'parent_account_id': all_accounts}
+        segments.update(self._weighted_choice_columns({
+            'size_segment': self.size_segments,
+            'market_segment': self.market_segments,
+            'trade_segment': self.trade_segments,
+            'product_category': self.product_categories
+        }, len(all_accounts)))
         
         return pd.DataFrame(segments)
     
@@ -808,59 +676,46 @@ class ACMEServicesDataGenerator:
             segments_df = self.generate_customer_segments()
         
         # Generate monthly data points from 2023 to 2025 (for year-over-year comparison)
-        billing_data = []
-        
-        # Create proper month list to avoid invalid months
-        months_to_generate = []
-        for year in [2023, 2024, 2025]:
-            for month in range(1, 13):  # 1-12 for valid months
-                months_to_generate.append({
-                    'year': year,
-                    'month': month,
-                    'month_id': year * 100 + month,
-                    'billing_month': date(year, month, 1)
-                })
-        
-        for month_data in months_to_generate:
-            month_id = month_data['month_id']
-            billing_month = month_data['billing_month']
-            
-            for _, child_account in hierarchy_df.iterrows():
-                parent_id = child_account['parent_account_id']
-                
-                # Get segment info for this parent
-                segment_info = segments_df[segments_df['parent_account_id'] == parent_id].iloc[0]
-                
-                # Base ARR varies by segment
-                base_arr = {
-                    'SMB': random.randint(5000, 25000),
-                    'Mid-Market': random.randint(25000, 100000),
-                    'Enterprise': random.randint(100000, 500000)
-                }[segment_info['size_segment']]
-                
-                # Add growth/decline trends 
-                # Calculate months from Jan 2023 baseline
-                months_from_start = (month_data['year'] - 2023) * 12 + (month_data['month'] - 1)
-                growth_factor = 1 + (months_from_start * 0.01)  # 1% monthly growth baseline
-                
-                # Add some seasonality and randomness
-                seasonal_factor = 1 + 0.1 * np.sin(2 * np.pi * month_data['month'] / 12)
-                random_factor = random.uniform(0.8, 1.2)
-                
-                final_arr = base_arr * growth_factor * seasonal_factor * random_factor
-                
-                billing_data.append({
-                    'parent_account_id': parent_id,
-                    'child_account_id': child_account['child_account_id'],
-                    'ndr_parent': child_account['ndr_parent'],
-                    'month_id': month_id,
-                    'billing_month': billing_month,
-                    'l3m_arr': round(final_arr, 2),
-                    'size_segment': segment_info['size_segment'],
-                    'market_segment': segment_info['market_segment'],
-                    'trade_segment': segment_info['trade_segment'],
-                    'product_category': segment_info['product_category']
-                })
+        years = np.repeat([2023, 2024, 2025], 12)
+        month_numbers = np.tile(np.arange(1, 13), 3)
+        billing_months = np.array([date(year, month, 1) for year, month in zip(years, month_numbers)])
+        
+        # Attach segment info to each child account once
+        children = hierarchy_df.merge(segments_df, on='parent_account_id', how='inner', validate='many_to_one')
+        if len(children) != len(hierarchy_df):
+            raise ValueError("Every child account needs a customer segment for its parent")
+        
+        # One row per (month, child account), month-major
+        num_months, num_children = len(years), len(children)
+        month_idx = np.repeat(np.arange(num_months), num_children)
+        child_idx = np.tile(np.arange(num_children), num_months)
+        n = len(month_idx)
+        
+        # Base ARR varies by segment (SMB, Mid-Market, Enterprise)
+        arr_low = np.array([5000, 25000, 100000])
+        arr_high = np.array([25000, 100000, 500000])
+        size_idx = self._codes(self.size_segments, children['size_segment'])[child_idx]
+        base_arr = np.random.randint(arr_low[size_idx], arr_high[size_idx] + 1)
+        
+        # Add growth/decline trends: 1% monthly growth baseline from Jan 2023
+        growth_factor = 1 + np.arange(num_months) * 0.01
+        
+        # Add some seasonality and randomness
+        seasonal_factor = 1 + 0.1 * np.sin(2 * np.pi * month_numbers / 12)
+        random_factor = np.random.uniform(0.8, 1.2, n)
+        
+        final_arr = base_arr * growth_factor[month_idx] * seasonal_factor[month_idx] * random_factor
+        
+        billing_data = {
+            'parent_account_id': children['parent_account_id'].to_numpy()[child_idx],
+            'child_account_id': children['child_account_id'].to_numpy()[child_idx],
+            'ndr_parent': children['ndr_parent'].to_numpy()[child_idx],
+            'month_id': (years * 100 + month_numbers)[month_idx],
+            'billing_month': billing_months[month_idx],
+            'l3m_arr': np.round(final_arr, 2)
+        }
+        for column in ('size_segment', 'market_segment', 'trade_segment', 'product_category'):
+            billing_data[column] = children[column].to_numpy()[child_idx]
         
         return pd.DataFrame(billing_data)
     
@@ -878,6 +733,7 @@ class ACMEServicesDataGenerator:
         ]
         
         products = []
+        now = datetime.now()
         for i in range(self.num_products):
             product_id = f"PROD_{str(i+1).zfill(3)}"
             
@@ -916,7 +772,7 @@ class ACMEServicesDataGenerator:
                 'family': product_family,
                 'is_deleted': False,
                 'is_active': True,
-                'created_date': datetime.now() - timedelta(days=random.randint(100, 1000)),
+                'created_date': now - timedelta(days=random.randint(100, 1000)),
                 'unit_price': round(random.uniform(25, 500), 2)
             }
             
@@ -960,34 +816,37 @@ class ACMEServicesDataGenerator:
         """Generate sales opportunities"""
         logger.info(f"Generating {self.num_opportunities} opportunities...")
         
-        opportunities = []
+        n = self.num_opportunities
         stage_weights = {'Closed Won': 0.6, 'Closed Lost': 0.2, 'Proposal': 0.1, 'Negotiation': 0.1}
-        
-        for i in range(self.num_opportunities):
-            opp_id = f"OPP_{str(i+1).zfill(5)}"
-            account = accounts_df.sample(1).iloc[0]
-            
-            stage = self._weighted_choice(stage_weights)
-            amount = round(random.uniform(5000, 50000), 2)
-            
-            # Create date within last 2 years
-            created_date = datetime.now().date() - timedelta(days=random.randint(30, 730))
-            close_date = created_date + timedelta(days=random.randint(30, 180))
-            
-            opportunity = {
-                'id': opp_id,
-                'account_id': account['id'],
-                'name': f"{account['name']} - Service Contract {i+1}",
-                'stage_name': stage,
-                'amount': amount,
-                'close_date': close_date,
-                'created_date': created_date,
-                'is_won': stage == 'Closed Won',
-                'is_closed': stage in ['Closed Won', 'Closed Lost'],
-                'probability': 100 if stage == 'Closed Won' else 0 if stage == 'Closed Lost' else random.randint(25, 75)
-            }
-            
-            opportunities.append(opportunity)
+        today = np.datetime64(datetime.now().date())
+        
+        # Pick all accounts at once
+        account_idx = np.random.randint(0, len(accounts_df), n)
+        account_ids = accounts_df['id'].to_numpy()[account_idx]
+        account_names = accounts_df['name'].to_numpy()[account_idx]
+        
+        stage = self._weighted_choices(stage_weights, n)
+        amount = np.round(np.random.uniform(5000, 50000, n), 2)
+        
+        # Create date within last 2 years
+        created_date = today - np.random.randint(30, 731, n).astype('timedelta64[D]')
+        close_date = created_date + np.random.randint(30, 181, n).astype('timedelta64[D]')
+        
+        is_won = stage == 'Closed Won'
+        is_lost = stage == 'Closed Lost'
+        
+        opportunities = {
+            'id': [f"OPP_{str(i+1).zfill(5)}" for i in range(n)],
+            'account_id': account_ids,
+            'name': [f"{name} - Service Contract {i+1}" for i, name in enumerate(account_names)],
+            'stage_name': stage,
+            'amount': amount,
+            'close_date': pd.DatetimeIndex(close_date).date,
+            'created_date': pd.DatetimeIndex(created_date).date,
+            'is_won': is_won,
+            'is_closed': is_won | is_lost,
+            'probability': np.where(is_won, 100, np.where(is_lost, 0, np.random.randint(25, 76, n)))
+        }
         
         return pd.DataFrame(opportunities)
     
@@ -999,107 +858,100 @@ class ACMEServicesDataGenerator:
         
         # Filter to won opportunities
         won_opps = opportunities_df[opportunities_df['is_won']]
+        num_contracts = len(won_opps)
+        
+        # Create one contract per won opportunity
+        contract_ids = np.array([f"CONTRACT_{str(i+1).zfill(5)}" for i in range(num_contracts)], dtype=object)
+        contract_status = self._weighted_choices(self.contract_statuses, num_contracts)
+        account_ids = won_opps['account_id'].to_numpy()
+        opportunity_ids = won_opps['id'].to_numpy()
+        
+        # Contract dates (1 year contracts)
+        contract_start = pd.to_datetime(won_opps['close_date']).to_numpy().astype('datetime64[D]')
+        contract_end = contract_start + np.timedelta64(365, 'D')
+        
+        contracts = {
+            'id': contract_ids,
+            'account_id': account_ids,
+            'opportunity_id': opportunity_ids,
+            'status': contract_status,
+            'start_date': pd.DatetimeIndex(contract_start).date,
+            'end_date': pd.DatetimeIndex(contract_end).date,
+            'term': 12,  # months
+            'created_date': won_opps['close_date'].to_numpy()
+        }
         
-        contracts = []
-        orders = []
-        order_items = []
+        # Create 1-3 orders per contract, flattened to one row per order
+        num_orders = np.random.randint(1, 4, num_contracts)
+        order_contract = np.repeat(np.arange(num_contracts), num_orders)
+        total_orders = len(order_contract)
+        order_num = np.arange(total_orders) - np.repeat(np.cumsum(num_orders) - num_orders, num_orders)
+        is_master = order_num == 0
+        
+        order_ids = np.array([f"ORDER_{str(i+1).zfill(5)}" for i in range(total_orders)], dtype=object)
+        order_status = np.where(
+            contract_status[order_contract] == 'Activated',
+            self._weighted_choices(self.order_statuses, total_orders),
+            contract_status[order_contract]
+        )
+        order_type = np.where(is_master, 'New', np.random.choice(['Amendment', 'Renewal', 'Upsell'], total_orders))
+        order_created = contract_start[order_contract] + (order_num * 30).astype('timedelta64[D]')
+        
+        orders = {
+            'id': order_ids,
+            'contract_id': contract_ids[order_contract],
+            'account_id': account_ids[order_contract],
+            'opportunity_id': opportunity_ids[order_contract],
+            'status': order_status,
+            'type': order_type,
+            'order_number': [f"ORD-{i+1:05d}" for i in range(total_orders)],
+            'created_date': pd.DatetimeIndex(order_created).date,
+            'activated_date': pd.DatetimeIndex(order_created + np.timedelta64(1, 'D')).date,
+            'master_order_c': order_ids[np.arange(total_orders) - order_num],
+            'is_master_order_c': is_master,
+            'has_child_orders': is_master & (num_orders[order_contract] > 1),
+            'is_migrated_c': False
+        }
         
-        contract_counter = 1
-        order_counter = 1
-        order_item_counter = 1
+        # Create order items (products on each order), flattened to one row per item
+        num_items = np.random.randint(1, self.avg_order_items_per_contract + 1, total_orders)
+        item_order = np.repeat(np.arange(total_orders), num_items)
+        total_items = len(item_order)
+        product_idx = np.random.randint(0, len(products_df), total_items)
         
-        for _, opp in won_opps.iterrows():
-            # Create contract
-            contract_id = f"CONTRACT_{str(contract_counter).zfill(5)}"
-            contract_status = self._weighted_choice(self.contract_statuses)
-            
-            # Contract dates
-            contract_start = opp['close_date']
-            contract_end = contract_start + timedelta(days=365)  # 1 year contracts
-            
-            contract = {
-                'id': contract_id,
-                'account_id': opp['account_id'],
-                'opportunity_id': opp['id'],
-                'status': contract_status,
-                'start_date': contract_start,
-                'end_date': contract_end,
-                'term': 12,  # months
-                'created_date': opp['close_date']
-            }
-            contracts.append(contract)
-            
-            # Create 1-3 orders per contract
-            num_orders = random.randint(1, 3)
-            
-            for order_num in range(num_orders):
-                order_id = f"ORDER_{str(order_counter).zfill(5)}"
-                order_status = self._weighted_choice(self.order_statuses) if contract_status == 'Activated' else contract_status
-                
-                order_type = 'New' if order_num == 0 else random.choice(['Amendment', 'Renewal', 'Upsell'])
-                
-                order = {
-                    'id': order_id,
-                    'contract_id': contract_id,
-                    'account_id': opp['account_id'],
-                    'opportunity_id': opp['id'],
-                    'status': order_status,
-                    'type': order_type,
-                    'order_number': f"ORD-{order_counter:05d}",
-                    'created_date': contract_start + timedelta(days=order_num * 30),
-                    'activated_date': contract_start + timedelta(days=order_num * 30 + 1),
-                    'master_order_c': order_id if order_num == 0 else f"ORDER_{str(order_counter - order_num).zfill(5)}",
-                    'is_master_order_c': order_num == 0,
-                    'has_child_orders': num_orders > 1 and order_num == 0,
-                    'is_migrated_c': False
-                }
-                orders.append(order)
-                
-                # Create order items (products on this order)
-                num_items = random.randint(1, self.avg_order_items_per_contract)
-                
-                for item_num in range(num_items):
-                    product = products_df.sample(1).iloc[0]
-                    order_item_id = f"ORDER_ITEM_{str(order_item_counter).zfill(5)}"
-                    
-                    # Quantities and pricing
-                    quantity = random.randint(1, 10)
-                    unit_price = product['unit_price'] * random.uniform(0.8, 1.2)  # Some price variation
-                    
-                    # Commitment calculation - core products have minimums
-                    if 'User' in product['name'] or 'Managed Services' in product['name']:
-                        min_committed_quantity = quantity
-                    else:
-                        min_committed_quantity = max(1, int(quantity * 0.8))  # 80% commitment for add-ons
-                    
-                    # Exit ramp logic (10% of items are exit ramps)
-                    is_exit_ramp = random.random() < 0.1
-                    
-                    order_item = {
-                        'id': order_item_id,
-                        'order_id': order_id,
-                        'contract_id': contract_id,
-                        'product_id': product['id'],
-                        'product_code': product['product_code'],
-                        'quantity': quantity,
-                        'unit_price': round(unit_price, 2),
-                        'total_price': round(quantity * unit_price, 2),
-                        'min_committed_quantity': min_committed_quantity,
-                        'total_min_commitment': round(min_committed_quantity * unit_price, 2),
-                        'start_date': order['created_date'],
-                        'end_date': contract_end,
-                        'billing_day_of_month': random.randint(1, 28),
-                        'created_date': order['created_date'],
-                        'is_exit_ramp': is_exit_ramp,
-                        'exit_ramp_c': is_exit_ramp,
-                        'product_family': product['family']
-                    }
-                    order_items.append(order_item)
-                    order_item_counter += 1
-                
-                order_counter += 1
-            
-            contract_counter += 1
+        # Quantities and pricing, with some price variation
+        quantity = np.random.randint(1, 11, total_items)
+        unit_price = products_df['unit_price'].to_numpy()[product_idx] * np.random.uniform(0.8, 1.2, total_items)
+        
+        # Commitment calculation - core products have minimums, add-ons commit to 80%
+        is_core_product = products_df['name'].str.contains('User|Managed Services').to_numpy()
+        min_committed_quantity = np.where(
+            is_core_product[product_idx], quantity, np.maximum(1, (quantity * 0.8).astype(int))
+        )
+        
+        # Exit ramp logic (10% of items are exit ramps)
+        is_exit_ramp = np.random.random(total_items) < 0.1
+        item_start = pd.DatetimeIndex(order_created[item_order]).date
+        
+        order_items = {
+            'id': [f"ORDER_ITEM_{str(i+1).zfill(5)}" for i in range(total_items)],
+            'order_id': order_ids[item_order],
+            'contract_id': contract_ids[order_contract[item_order]],
+            'product_id': products_df['id'].to_numpy()[product_idx],
+            'product_code': products_df['product_code'].to_numpy()[product_idx],
+            'quantity': quantity,
+            'unit_price': np.round(unit_price, 2),
+            'total_price': np.round(quantity * unit_price, 2),
+            'min_committed_quantity': min_committed_quantity,
+            'total_min_commitment': np.round(min_committed_quantity * unit_price, 2),
+            'start_date': item_start,
+            'end_date': pd.DatetimeIndex(contract_end[order_contract[item_order]]).date,
+            'billing_day_of_month': np.random.randint(1, 29, total_items),
+            'created_date': item_start,
+            'is_exit_ramp': is_exit_ramp,
+            'exit_ramp_c': is_exit_ramp,
+            'product_family': products_df['family'].to_numpy()[product_idx]
+        }
         
         return pd.DataFrame(contracts), pd.DataFrame(orders), pd.DataFrame(order_items)
     
@@ -1108,98 +960,72 @@ class ACMEServicesDataGenerator:
         """Generate SFDC billing invoices and invoice lines linked to contracts"""
         logger.info("Generating SFDC invoices with proper contract linkage...")
         
-        invoices = []
-        invoice_lines = []
-        invoice_counter = 1
-        line_counter = 1
+        today = datetime.now().date()
+        current_month_start = np.datetime64(today, 'M')
+        
+        # Generate monthly invoices for active recurring items; every order item
+        # carries the contract it was created under
+        recurring = order_items_df[order_items_df['product_family'] == 'Recurring Revenue']
+        contract_ids = recurring['contract_id']
+        
+        # One invoice per month from the item's start month through its end month (capped at today)
+        start_month = pd.to_datetime(recurring['start_date']).to_numpy().astype('datetime64[M]')
+        end_month = np.minimum(pd.to_datetime(recurring['end_date']).to_numpy().astype('datetime64[M]'),
+                               current_month_start)
+        months_per_item = np.maximum((end_month - start_month).astype(int) + 1, 0)
+        n = int(months_per_item.sum())
+        if n == 0:
+            return pd.DataFrame()
+        
+        item_idx = np.repeat(np.arange(len(recurring)), months_per_item)
+        month_offset = np.arange(n) - np.repeat(np.cumsum(months_per_item) - months_per_item, months_per_item)
+        invoice_month = start_month[item_idx] + month_offset
+        invoice_date = invoice_month.astype('datetime64[D]')
+        
+        order_ids = recurring['order_id'].to_numpy()[item_idx]
+        contract_id = contract_ids.to_numpy()[item_idx]
+        unit_price = recurring['unit_price'].to_numpy()[item_idx]
+        quantity = recurring['quantity'].to_numpy()[item_idx]
+        
+        # Calculate invoice amounts with variance (more realistic variance for better patterns)
+        subtotal = unit_price * quantity * np.random.uniform(0.75, 1.3, n)
+        tax_amount = subtotal * 0.08  # 8% tax
+        total_amount = subtotal + tax_amount
+        
+        # Invoice status
+        invoice_status = np.where(
+            (invoice_month <= current_month_start) & (np.random.random(n) < 0.5), 'Posted', 'Draft'
+        )
+        payment_status = np.where((invoice_status == 'Posted') & (np.random.random(n) < 0.9), 'Paid', 'Unpaid')
+        
+        month_labels = pd.DatetimeIndex(invoice_date).strftime('%B %Y')
+        invoice_ids = [f"SF_INV_{str(i+1).zfill(5)}" for i in range(n)]
+        
+        # Each invoice has exactly one line, so invoices and lines are combined into
+        # a single structure for simplicity (in reality these would be separate tables)
+        combined_invoices = {
+            'id': [f"SF_INV_LINE_{str(i+1).zfill(5)}" for i in range(n)],
+            'blng_account_c': order_ids,  # Keep order link
+            'contract_id': contract_id,
+            'blng_invoice_date_c': pd.DatetimeIndex(invoice_date).date,
+            'blng_total_amount_c': np.round(total_amount, 2),
+            'blng_tax_amount_c': np.round(tax_amount, 2),
+            'blng_invoice_status_c': invoice_status,
+            'blng_payment_status_c': payment_status,
+            'invoice_long_description_c': [
+                f"Monthly billing for {label} - Contract: {cid}" for label, cid in zip(month_labels, contract_id)
+            ],
+            'is_deleted': False,
+            'blng_invoice_c': invoice_ids,
+            'blng_product_c': recurring['product_id'].to_numpy()[item_idx],
+            'blng_unit_price_c': unit_price,
+            'blng_quantity_c': quantity,
+            'blng_subtotal_c': subtotal,
+            'blng_start_date_c': pd.DatetimeIndex(invoice_date).date,
+            'blng_end_date_c': pd.DatetimeIndex(invoice_date + np.timedelta64(27, 'D')).date  # End of month
+        }
         
-        # Create a mapping of order_id to contract_id for proper linking
-        order_to_contract = {}
-        for _, contract in contracts_df.iterrows():
-            for _, order in order_items_df.iterrows():
-                if order['order_id'].startswith('ORDER_') and contract['id'].startswith('CONTRACT_'):
-                    # Link orders to contracts based on account_id
-                    if hasattr(order, 'account_id') or 'account_id' in order:
-                        order_account = order.get('account_id', None)
-                        contract_account = contract.get('account_id', None)
-                        if order_account == contract_account:
-                            order_to_contract[order['order_id']] = contract['id']
-                            break
-        
-        # Generate invoices for order items with contract linkage
-        for _, order_item in order_items_df.iterrows():
-            # Generate monthly invoices for active recurring items
-            if order_item['product_family'] == 'Recurring Revenue':
-                contract_id = order_to_contract.get(order_item['order_id'])
-                if not contract_id:
-                    # If no contract link, skip or create a default contract reference
-                    continue
-                    
-                start_month = order_item['start_date']
-                end_month = min(order_item['end_date'], datetime.now().date())
-                
-                current_month = start_month.replace(day=1)
-                while current_month <= end_month.replace(day=1):
-                    invoice_id = f"SF_INV_{str(invoice_counter).zfill(5)}"
-                    
-                    # Calculate invoice amounts with variance (80-120% of expected)
-                    base_amount = order_item['unit_price'] * order_item['quantity']
-                    variance_factor = random.uniform(0.75, 1.3)  # More realistic variance for better patterns
-                    subtotal = base_amount * variance_factor
-                    
-                    tax_rate = 0.08  # 8% tax
-                    tax_amount = subtotal * tax_rate
-                    total_amount = subtotal + tax_amount
-                    
-                    # Invoice status
-                    invoice_status = random.choice(['Posted', 'Draft']) if current_month <= datetime.now().date().replace(day=1) else 'Draft'
-                    payment_status = 'Paid' if invoice_status == 'Posted' and random.random() < 0.9 else 'Unpaid'
-                    
-                    invoice = {
-                        'id': invoice_id,
-                        'blng_account_c': order_item['order_id'],  # Keep order link
-                        'contract_id': contract_id,  # ADD CONTRACT LINK
-                        'blng_invoice_date_c': current_month,
-                        'blng_total_amount_c': round(total_amount, 2),
-                        'blng_tax_amount_c': round(tax_amount, 2),
-                        'blng_invoice_status_c': invoice_status,
-                        'blng_payment_status_c': payment_status,
-                        'invoice_long_description_c': f"Monthly billing for {current_month.strftime('%B %Y')} - Contract: {contract_id}",
-                        'is_deleted': False
-                    }
-                    invoices.append(invoice)
-                    
-                    # Create invoice line
-                    line_id = f"SF_INV_LINE_{str(line_counter).zfill(5)}"
-                    invoice_line = {
-                        'id': line_id,
-                        'blng_invoice_c': invoice_id,
-                        'contract_id': contract_id,  # ADD CONTRACT LINK TO LINE
-                        'blng_product_c': order_item['product_id'],
-                        'blng_unit_price_c': order_item['unit_price'],
-                        'blng_quantity_c': order_item['quantity'],
-                        'blng_subtotal_c': subtotal,
-                        'blng_start_date_c': current_month,
-                        'blng_end_date_c': current_month.replace(day=28),  # End of month
-                        'blng_tax_amount_c': round(tax_amount, 2),
-                        'is_deleted': False
-                    }
-                    invoice_lines.append(invoice_line)
-                    
-                    line_counter += 1
-                    invoice_counter += 1
-                    current_month = (current_month + timedelta(days=32)).replace(day=1)
-        
-        # Combine invoices and lines into a single structure for simplicity
-        # In reality, these would be separate tables
-        combined_invoices = []
-        for invoice in invoices:
-            matching_lines = [line for line in invoice_lines if line['blng_invoice_c'] == invoice['id']]
-            for line in matching_lines:
-                combined_invoice = {**invoice, **line}
-                combined_invoices.append(combined_invoice)
-        
-        return pd.DataFrame(combined_invoices) if combined_invoices else pd.DataFrame()
+        return pd.DataFrame(combined_invoices)
     
     def generate_acme_billing_data(self, accounts_df: pd.DataFrame, contracts_df: pd.DataFrame) -> pd.DataFrame:
         """Generate ACME Platform billing data linked to contracts"""
@@ -1207,6 +1033,7 @@ class ACMEServicesDataGenerator:
         
         acme_invoices = []
         invoice_counter = 1
+        current_month_start = datetime.now().date().replace(day=1)
         
         # Create account to contract mapping for linkage
         account_contracts = {}
@@ -1236,7 +1063,7 @@ class ACMEServicesDataGenerator:
                 
                 # Generate 6 months of billing history
                 for month_offset in range(6):
-                    trans_date = datetime.now().date().replace(day=1) - timedelta(days=30 * month_offset)
+                    trans_date = current_month_start - timedelta(days=30 * month_offset)
                     
                     # Generate invoice for random ACME Platform products
                     selected_skus = random.sample(list(self.acme_product_skus.keys()), random.randint(1, 3))
@@ -1597,9 +1424,6 @@ class ACMEServicesDataGenerator:
         logger.info("Including ACME Annual Report document...")
         documents_df = self.generate_documents()
         
-        # Store original dataframes for summary (before column name changes)
-        orig_technicians_df = technicians_df.copy()
-        
         # Load to Snowflake  
         self.load_data_to_snowflake(
             customers_df, technicians_df, jobs_df, reviews_df,
@@ -1614,7 +1438,7 @@ class ACMEServicesDataGenerator:
         logger.info("ACME INTELLIGENCE DEMO DATA SUMMARY")
         logger.info("="*60)
         logger.info(f"Generated {len(customers_df)} service companies")
-        logger.info(f"Generated {len(orig_technicians_df)} technicians")
+        logger.info(f"Generated {len(technicians_df)} technicians")
         logger.info(f"Generated {len(jobs_df)} service jobs")
         logger.info(f"Generated {len(reviews_df)} customer reviews")
         logger.info(f"Generated {len(tenant_hierarchy_df)} tenant relationships")
@@ -1630,8 +1454,8 @@ class ACMEServicesDataGenerator:
         logger.info(f"Generated {len(st_billing_df)} ACME Platform billing records")
         logger.info(f"Generated {len(parent_child_mapping_df)} account mappings")
         logger.info("\nUNDERPERFORMING TECHNICIANS FOR DEMO:")
-        for tech_id in self.underperforming_technicians:
-            tech_info = orig_technicians_df[orig_technicians_df['technician_id'] == tech_id].iloc[0]
+        for tech_id in sorted(self.underperforming_technicians):
+            tech_info = technicians_df[technicians_df['technician_id'] == tech_id].iloc[0]
             logger.info(f"- {tech_id}: {tech_info['first_name']} {tech_info['last_name']}")
         logger.info("="*60)
         
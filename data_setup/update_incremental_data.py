@@ -23,7 +23,7 @@ class IncrementalDataUpdater:
     def __init__(self, connection_name: str = 'snowflake_intelligence'):
         self.connection_name = connection_name
         # Underperforming technicians from original data
-        self.underperforming_technicians = ['TECH_015', 'TECH_023']
+        self.underperforming_technicians = frozenset({'TECH_015', 'TECH_023'})
         
         # Seed for reproducible results
         random.seed(42)